@@ -1,76 +1,88 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-import wood_density
+from wood_density import ElementProperties, WeightCalculator, WoodProperties, density_grid
 
+SESSION_STATE_DEFAULTS = {
+    "fig1": None,
+    "fig2": None,
+    "density_results": None,
+    "weight_results": None,
+}
 
 
-class WoodProperties:
-    """
-    Represents the properties of a wood type.
-
-    Args:
-        name: The name of the wood.
-        specific_gravity: The specific gravity of the wood.
-        fibre_saturation_point: The fiber saturation point of the wood (%).
-
-    Returns:
-        None
-
-    Assumptions:
-        None
-    """
-    def __init__(self, name: str, specific_gravity: float, fibre_saturation_point: float):
-        self.name = name
-        self.specific_gravity = specific_gravity
-        self.fibre_saturation_point = fibre_saturation_point
-
-
-class ElementProperties:
+def create_contour_plot(x, y, z, xlabel, ylabel, title, colorbar_label, scatter_x,
+                        scatter_y, fig=None):
     """
-    Represents the properties of a structural element.
+    Draws a filled contour plot with a marker at the selected point.
 
     Args:
-        name: The name of the element.
-        width: The width of the element (m).
-        depth: The depth of the element (m).
-        length: The length of the element (m).
+        fig: A figure previously returned by this function. When given, its
+            contour, colorbar and marker are redrawn in place instead of
+            building a new figure.
 
     Returns:
-        None
+        The matplotlib figure.
 
     Assumptions:
-        None
+        The axis labels and title of a reused figure do not change.
     """
-
-    def __init__(self, name: str, width: float, depth: float, length: float):
-        self.name = name
-        self.width = width
-        self.depth = depth
-        self.length = length
-
-def create_contour_plot(x, y, z, xlabel, ylabel, title, colorbar_label, scatter_x,
-                        scatter_y):
-    fig, ax = plt.subplots(figsize=(6, 5))
-    contour = ax.contourf(x, y, z, cmap="viridis")
-    ax.set_xlabel(xlabel, fontsize=8)
-    ax.set_ylabel(ylabel, fontsize=8)
-    ax.set_title(title, fontsize=10)
-    cbar = fig.colorbar(contour, label=colorbar_label)
+    if fig is None:
+        fig, ax = plt.subplots(figsize=(3, 2.5))
+        ax.set_xlabel(xlabel, fontsize=8)
+        ax.set_ylabel(ylabel, fontsize=8)
+        ax.set_title(title, fontsize=10)
+        ax.tick_params(axis='both', which='major', labelsize=6)
+        plt.close(fig)
+        cax = None
+    else:
+        ax, cax = fig.axes
+        for artist in list(ax.collections):
+            artist.remove()
+        ax.ignore_existing_data_limits = True
+        cax.clear()
+
+    contour = ax.contourf(x, y, z, cmap="viridis", algorithm="serial")
+    cbar = fig.colorbar(contour, cax=cax, label=colorbar_label)
     cbar.ax.tick_params(labelsize=8)
     cbar.set_label(colorbar_label, fontsize=8)
-    ax.tick_params(axis='both', which='major', labelsize=6)
     ax.scatter(
         scatter_x,
         scatter_y,
         color="red",
         marker="o",
         s=100,
+        zorder=3,
     )
-    fig.set_size_inches(fig.get_size_inches() * 0.50)
     return fig
 
 
+@st.cache_data
+def compute_grids(fibre_saturation_point, volume, moisture_max, specific_gravity_max):
+    """
+    Computes the density and weight grids shown in the contour plots.
+
+    Args:
+        fibre_saturation_point: The fiber saturation point of the wood (%).
+        volume: The volume of the element (m³), as given by ElementProperties.volume.
+        moisture_max: The upper bound of the moisture content axis (%).
+        specific_gravity_max: The upper bound of the specific gravity axis.
+
+    Returns:
+        A tuple (moisture_range, specific_gravity_range, density, weight) where
+        density (kg/m³) and weight (kg) are indexed [specific_gravity, moisture].
+        All arrays are float32, which is ample precision for a contour plot.
+
+    Assumptions:
+        The inputs have already been validated by WeightCalculator.
+    """
+    moisture_range = np.linspace(0, moisture_max, 100, dtype=np.float32)
+    specific_gravity_range = np.linspace(0.3, specific_gravity_max, 100, dtype=np.float32)
+    density = density_grid(specific_gravity_range, fibre_saturation_point, moisture_range)
+    weight = density * volume
+    return moisture_range, specific_gravity_range, density, weight
+
+
 def main():
     st.set_page_config(
         page_title="Calculadora de densidad y peso de una pieza de madera",
@@ -103,21 +115,8 @@ def main():
         "Contenido de Humedad (%)", value=18.0, step=0.5
     )
 
-    if "tab_selection" not in st.session_state:
-        st.session_state.tab_selection = "Resumen"
-
-    if "fig1" not in st.session_state:
-        st.session_state.fig1 = None
-    if "fig2" not in st.session_state:
-        st.session_state.fig2 = None
-    if "density_results" not in st.session_state:
-        st.session_state.density_results = None
-    if "weight_results" not in st.session_state:
-        st.session_state.weight_results = None
-    if "moisture_grid" not in st.session_state:
-        st.session_state.moisture_grid = None
-    if "specific_gravity_grid" not in st.session_state:
-        st.session_state.specific_gravity_grid = None
+    for key, value in SESSION_STATE_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
     if st.button("Calcular y Mostrar"):
         try:
@@ -130,26 +129,16 @@ def main():
                 element_depth,
                 element_length,
             )
-            calculator = wood_density.WeightCalculator(wood, element)
+            calculator = WeightCalculator(wood, element)
 
             tab1, tab2, tab3 = st.tabs(["Resumen", "Gráfico de Densidad", "Gráfico de Peso"])
 
-            st.session_state.tab_selection = "Resumen"
-            if tab2:
-                st.session_state.tab_selection = "Gráfico de Densidad"
-            if tab3:
-                st.session_state.tab_selection = "Gráfico de Peso"
-
             with tab1:
                 st.subheader("Resultados:")
-                wood_point = WoodProperties(
-                    wood_name, wood_specific_gravity, wood_fibre_saturation_point
-                )
-                calculator_point = wood_density.WeightCalculator(wood_point, element)
-                density_point = calculator_point.calculate_density_at_moisture_content(
+                density_point = calculator.calculate_density_at_moisture_content(
                     moisture_point
                 )
-                weight_point = calculator_point.calculate_weight_at_moisture_content(
+                weight_point = calculator.calculate_weight_at_moisture_content(
                     moisture_point
                 )
 
@@ -172,31 +161,22 @@ def main():
                         label="",
                         value=f"{weight_point:.2f} kg",
                     )
-            with tab2:
-
-                moisture_range = np.linspace(0, max(40, moisture_point), 100)
-                specific_gravity_range = np.linspace(0.3, max(1.0, wood_specific_gravity), 100)
-                st.session_state.moisture_grid, st.session_state.specific_gravity_grid = np.meshgrid(
-                    moisture_range, specific_gravity_range
-                )
+            (
+                moisture_range,
+                specific_gravity_range,
+                st.session_state.density_results,
+                st.session_state.weight_results,
+            ) = compute_grids(
+                wood_fibre_saturation_point,
+                element.volume,
+                max(40, moisture_point),
+                max(1.0, wood_specific_gravity),
+            )
 
-                st.session_state.density_results = np.array(
-                    [
-                        [
-                            wood_density.WeightCalculator(
-                                WoodProperties(
-                                    wood_name, sg, wood_fibre_saturation_point
-                                ),
-                                element,
-                            ).calculate_density_at_moisture_content(mc)
-                            for mc in moisture_range
-                        ]
-                        for sg in specific_gravity_range
-                    ]
-                )
+            with tab2:
                 st.session_state.fig1 = create_contour_plot(
-                    st.session_state.moisture_grid,
-                    st.session_state.specific_gravity_grid,
+                    moisture_range,
+                    specific_gravity_range,
                     st.session_state.density_results,
                     "Contenido de Humedad (%)",
                     "Gravedad Específica",
@@ -204,33 +184,14 @@ def main():
                     "Densidad (kg/m³)",
                     moisture_point,
                     wood_specific_gravity,
+                    fig=st.session_state.fig1,
                 )
-                st.pyplot(st.session_state.fig1)
+                st.pyplot(st.session_state.fig1, clear_figure=False)
 
             with tab3:
-                moisture_range = np.linspace(0, max(40, moisture_point), 100)
-                specific_gravity_range = np.linspace(0.3, max(1.0, wood_specific_gravity), 100)
-                st.session_state.moisture_grid, st.session_state.specific_gravity_grid = np.meshgrid(
-                    moisture_range, specific_gravity_range
-                )
-
-                st.session_state.weight_results = np.array(
-                    [
-                        [
-                            wood_density.WeightCalculator(
-                                WoodProperties(
-                                    wood_name, sg, wood_fibre_saturation_point
-                                ),
-                                element,
-                            ).calculate_weight_at_moisture_content(mc)
-                            for mc in moisture_range
-                        ]
-                        for sg in specific_gravity_range
-                    ]
-                )
                 st.session_state.fig2 = create_contour_plot(
-                    st.session_state.moisture_grid,
-                    st.session_state.specific_gravity_grid,
+                    moisture_range,
+                    specific_gravity_range,
                     st.session_state.weight_results,
                     "Contenido de Humedad (%)",
                     "Gravedad Específica",
@@ -238,19 +199,15 @@ def main():
                     "Peso (kg)",
                     moisture_point,
                     wood_specific_gravity,
+                    fig=st.session_state.fig2,
                 )
-                st.pyplot(st.session_state.fig2)
+                st.pyplot(st.session_state.fig2, clear_figure=False)
 
         except ValueError as e:
             st.error(f"Error: {e}")
         except TypeError as e:
             st.error(f"Error: {e}")
 
-    if st.session_state.tab_selection == "Gráfico de Densidad":
-        st.session_state.tab_selection = "Gráfico de Densidad"
-    if st.session_state.tab_selection == "Gráfico de Peso":
-        st.session_state.tab_selection = "Gráfico de Peso"
-
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,12 @@
 import pytest
-from wood_density import WoodProperties, ElementProperties, WeightCalculator
+import numpy as np
+from wood_density import (
+    ElementArray,
+    ElementProperties,
+    WeightCalculator,
+    WoodProperties,
+    density_grid,
+)
 
 
 @pytest.fixture
@@ -7,7 +14,7 @@ def example_material():
     """
     Creates a sample WoodProperties object for testing.
     """
-    return WoodProperties(specific_gravity=0.7, fibre_saturation_point=25.0)
+    return WoodProperties(name="test", specific_gravity=0.7, fibre_saturation_point=25.0)
 
 
 @pytest.fixture
@@ -15,7 +22,7 @@ def example_element():
     """
     Creates a sample ElementProperties object for testing.
     """
-    return ElementProperties(width=0.2, depth=0.05, length=2.5)
+    return ElementProperties(name="test", width=0.2, depth=0.05, length=2.5)
 
 
 def test_weight_calculator_valid_input(example_material, example_element):
@@ -58,14 +65,13 @@ def test_weight_calculator_invalid_element_dimensions(
     example_material, invalid_width, invalid_depth, invalid_length
 ):
     """
-    Test the weight calculation with invalid element dimensions.
+    Test that invalid element dimensions are rejected on construction.
     """
     element = ElementProperties(
-        width=invalid_width, depth=invalid_depth, length=invalid_length
+        name="test", width=invalid_width, depth=invalid_depth, length=invalid_length
     )
-    calculator = WeightCalculator(example_material, element)
     with pytest.raises(ValueError):
-        calculator.calculate_weight_at_moisture_content(10)
+        WeightCalculator(example_material, element)
 
 
 def test_weight_calculator_density_at_moisture_content_valid(example_material, example_element):
@@ -78,6 +84,21 @@ def test_weight_calculator_density_at_moisture_content_valid(example_material, e
     assert density > 0
 
 
+def test_weight_calculator_density_cache_returns_float(example_material, example_element):
+    """
+    Test that a cached float32 call does not change the type of later float calls.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    calculator.calculate_density_at_moisture_content(np.float32(12.0))
+    density = calculator.calculate_density_at_moisture_content(12.0)
+    weight = calculator.calculate_weight_at_moisture_content(12.0)
+    assert type(density) is float
+    assert type(weight) is float
+    assert density == pytest.approx(
+        calculator.calculate_density_array(np.array([12.0]))[0], rel=1e-12
+    )
+
+
 def test_weight_calculator_density_at_moisture_content_invalid_type(example_material, example_element):
     """
     Test the density calculation with invalid moisture content type.
@@ -98,11 +119,185 @@ def test_weight_calculator_density_at_moisture_content_invalid_value(example_mat
 
 def test_weight_calculator_density_at_moisture_content_invalid_saturation_point(example_element):
     """
-    Test the density calculation with invalid fibre saturation point.
+    Test that an invalid fibre saturation point is rejected on construction.
+    """
+    material = WoodProperties(
+        name="test", specific_gravity=0.7, fibre_saturation_point=-25.0
+    )
+    with pytest.raises(ValueError):
+        WeightCalculator(material, example_element)
+
+
+def test_weight_calculator_invalid_specific_gravity(example_element):
+    """
+    Test that a negative specific gravity is rejected on construction.
     """
     material = WoodProperties(
-         specific_gravity=0.7, fibre_saturation_point=-25.0
+        name="test", specific_gravity=-0.7, fibre_saturation_point=25.0
     )
-    calculator = WeightCalculator(material, example_element)
     with pytest.raises(ValueError):
-        calculator.calculate_density_at_moisture_content(10)
\ No newline at end of file
+        WeightCalculator(material, example_element)
+
+
+def test_weight_calculator_reassigned_element(example_material, example_element):
+    """
+    Test that assigning a new element updates the cached volume.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    weight = calculator.calculate_weight_at_moisture_content(12.0)
+    calculator.element = ElementProperties(name="test", width=0.4, depth=0.05, length=2.5)
+    assert calculator.calculate_weight_at_moisture_content(12.0) == pytest.approx(2 * weight)
+    with pytest.raises(ValueError):
+        calculator.element = ElementProperties(name="test", width=-0.4, depth=0.05, length=2.5)
+
+
+def test_weight_calculator_density_array_matches_scalar(example_material, example_element):
+    """
+    Test the array density calculation against the scalar one.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    moisture_contents = np.array([0.0, 12.0, 25.0, 40.0])
+    densities = calculator.calculate_density_array(moisture_contents)
+    assert densities.shape == moisture_contents.shape
+    for moisture_content, density in zip(moisture_contents, densities):
+        assert density == pytest.approx(
+            calculator.calculate_density_at_moisture_content(float(moisture_content))
+        )
+
+
+def test_weight_calculator_density_array_invalid_value(example_material, example_element):
+    """
+    Test the array density calculation with a negative moisture content.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    with pytest.raises(ValueError):
+        calculator.calculate_density_array(np.array([12.0, -5.0]))
+
+
+def test_weight_calculator_accepts_moisture_content_array(example_material, example_element):
+    """
+    Test that the density and weight calculations accept an array of moisture contents.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    moisture_contents = np.array([0.0, 12.0, 25.0, 40.0])
+    densities = calculator.calculate_density_at_moisture_content(moisture_contents)
+    weights = calculator.calculate_weight_at_moisture_content(moisture_contents)
+    assert densities.shape == weights.shape == moisture_contents.shape
+    assert weights[1] == pytest.approx(calculator.calculate_weight_at_moisture_content(12.0))
+    with pytest.raises(ValueError):
+        calculator.calculate_weight_at_moisture_content(np.array([12.0, -5.0]))
+
+
+def test_weight_calculator_accepts_moisture_content_list(example_material, example_element):
+    """
+    Test that a list of moisture contents is evaluated like the equivalent array.
+    """
+    calculator = WeightCalculator(example_material, example_element)
+    densities = calculator.calculate_density_at_moisture_content([0.0, 12.0, 40.0])
+    assert isinstance(densities, np.ndarray)
+    assert densities == pytest.approx(
+        calculator.calculate_density_array(np.array([0.0, 12.0, 40.0]))
+    )
+
+
+def test_weights_batch_matches_scalar_weights(example_material, example_element):
+    """
+    Test the batch weight calculation against the scalar one for each element.
+    """
+    elements = [
+        example_element,
+        ElementProperties(name="test", width=0.1, depth=0.1, length=3.0),
+    ]
+    calculator = WeightCalculator(example_material, example_element)
+    weights = calculator.weights_batch(ElementArray.from_elements(elements), 12.0)
+    assert weights.shape == (2,)
+    for element, weight in zip(elements, weights):
+        expected = WeightCalculator(example_material, element).calculate_weight_at_moisture_content(12.0)
+        assert weight == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_element_array_from_elements_dtype(example_material, example_element, dtype):
+    """
+    Test that ElementArray.from_elements stores, and weights_batch returns, the requested dtype.
+    """
+    elements = ElementArray.from_elements([example_element], dtype=dtype)
+    assert elements.volumes.dtype == dtype
+    assert elements.widths.flags["C_CONTIGUOUS"]
+    calculator = WeightCalculator(example_material, example_element)
+    assert calculator.weights_batch(elements, 12.0).dtype == dtype
+
+
+def test_element_array_invalid_dimensions():
+    """
+    Test that negative dimensions are rejected when building an ElementArray.
+    """
+    with pytest.raises(ValueError):
+        ElementArray(widths=[0.2, -0.1], depths=[0.05, 0.05], lengths=[2.5, 2.5])
+
+
+def test_element_array_mismatched_shapes():
+    """
+    Test that dimension arrays of different shapes are rejected instead of broadcast.
+    """
+    with pytest.raises(ValueError):
+        ElementArray(widths=[1.0, 2.0, 3.0], depths=[1.0], lengths=[2.0])
+
+
+def test_element_array_is_immutable():
+    """
+    Test that an ElementArray cannot be changed after its volumes are computed.
+    """
+    widths = np.array([1.0, 2.0])
+    elements = ElementArray(widths=widths, depths=[1.0, 1.0], lengths=[1.0, 1.0])
+    with pytest.raises(AttributeError):
+        elements.widths = np.array([-5.0, -5.0])
+    with pytest.raises(ValueError):
+        elements.widths[0] = -5.0
+    widths[0] = 3.0
+    assert list(elements.volumes) == [1.0, 2.0]
+    assert elements != ElementArray(widths=widths, depths=[1.0, 1.0], lengths=[1.0, 1.0])
+
+
+def test_density_grid_matches_weight_calculator(example_element):
+    """
+    Test the density grid against the scalar calculation for each material.
+    """
+    specific_gravities = np.array([0.4, 0.7])
+    moisture_contents = np.array([0.0, 12.0, 25.0, 40.0])
+    densities = density_grid(specific_gravities, 25.0, moisture_contents)
+    assert densities.shape == (2, 4)
+    for i, specific_gravity in enumerate(specific_gravities):
+        material = WoodProperties(
+            name="test", specific_gravity=float(specific_gravity), fibre_saturation_point=25.0
+        )
+        calculator = WeightCalculator(material, example_element)
+        for j, moisture_content in enumerate(moisture_contents):
+            assert densities[i, j] == pytest.approx(
+                calculator.calculate_density_at_moisture_content(float(moisture_content))
+            )
+
+
+def test_density_grid_per_material_fibre_saturation_point(example_element):
+    """
+    Test the density grid with one fibre saturation point per specific gravity,
+    including a zero fibre saturation point, against the scalar calculation.
+    """
+    specific_gravities = np.array([0.4, 0.7, 0.5])
+    fibre_saturation_points = np.array([25.0, 30.0, 0.0])
+    moisture_contents = np.array([0.0, 12.0, 40.0])
+    densities = density_grid(specific_gravities, fibre_saturation_points, moisture_contents)
+    assert densities.shape == (3, 3)
+    for i, (specific_gravity, fibre_saturation_point) in enumerate(
+        zip(specific_gravities, fibre_saturation_points)
+    ):
+        material = WoodProperties(
+            name="test",
+            specific_gravity=float(specific_gravity),
+            fibre_saturation_point=float(fibre_saturation_point),
+        )
+        calculator = WeightCalculator(material, example_element)
+        for j, moisture_content in enumerate(moisture_contents):
+            assert densities[i, j] == pytest.approx(
+                calculator.calculate_density_at_moisture_content(float(moisture_content))
+            )
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class WoodProperties:
     """
     Represents the properties of a wood material.
@@ -22,7 +25,7 @@ class WoodProperties:
     fibre_saturation_point: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class ElementProperties:
     """
     Represents the properties of a structural element.
@@ -33,6 +36,9 @@ class ElementProperties:
         depth: The depth of the element.
         length: The length of the element.
 
+    Attributes:
+        volume: The volume of the element (width * depth * length).
+
     Returns:
         None
 
@@ -43,25 +49,116 @@ class ElementProperties:
     width: float
     depth: float
     length: float
+    volume: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "volume", self.width * self.depth * self.length)
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
+class ElementArray:
+    """
+    Represents the dimensions of many structural elements as contiguous arrays.
+
+    Args:
+        widths: The widths of the elements.
+        depths: The depths of the elements.
+        lengths: The lengths of the elements.
+
+    Attributes:
+        volumes: The volumes of the elements (widths * depths * lengths).
+
+    Returns:
+        None
+
+    Assumptions:
+        The three arrays have the same shape. Floating-point arrays keep their
+        dtype (float32 halves memory traffic for large portfolios); other
+        arrays are converted to float64. The arrays are copied and made
+        read-only, so volumes cannot go stale.
+    """
+    widths: np.ndarray
+    depths: np.ndarray
+    lengths: np.ndarray
+    volumes: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        widths = _as_float_array(self.widths)
+        depths = _as_float_array(self.depths)
+        lengths = _as_float_array(self.lengths)
+        if not widths.shape == depths.shape == lengths.shape:
+            raise ValueError("Element dimension arrays must have the same shape.")
+        if np.any(widths < 0) or np.any(depths < 0) or np.any(lengths < 0):
+            raise ValueError("Element dimensions must be non-negative values.")
+
+        volumes = widths * depths * lengths
+        for array in (widths, depths, lengths, volumes):
+            array.flags.writeable = False
+        object.__setattr__(self, "widths", widths)
+        object.__setattr__(self, "depths", depths)
+        object.__setattr__(self, "lengths", lengths)
+        object.__setattr__(self, "volumes", volumes)
+
+    @classmethod
+    def from_elements(
+        cls, elements: list[ElementProperties], dtype: np.dtype = np.float32
+    ) -> "ElementArray":
+        """
+        Stacks the dimensions of a list of elements into an ElementArray.
+
+        Args:
+            elements: The elements to stack.
+            dtype: The floating-point dtype of the arrays. Pass np.float64 when
+                full double precision is required.
+
+        Returns:
+            An ElementArray with one entry per element, in order.
+        """
+        return cls(
+            widths=np.array([element.width for element in elements], dtype=dtype),
+            depths=np.array([element.depth for element in elements], dtype=dtype),
+            lengths=np.array([element.length for element in elements], dtype=dtype),
+        )
+
+
+def _as_float_array(values) -> np.ndarray:
+    """
+    Returns a contiguous floating-point copy of values, keeping float dtypes.
+    """
+    array = np.array(values, order="C")
+    if not np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float64)
+    return array
 
 
 class WeightCalculator:
     """
     Calculates the weight of a wood element considering moisture content.
 
+    The material and element properties are validated, and the values derived
+    from them cached, whenever material or element is assigned.
+
     Attributes:
         material (WoodProperties): Properties of the wood material.
         element (ElementProperties): Properties of the structural element.
 
     Methods:
-        calculate_density_at_moisture_content(moisture_content) -> float:
+        calculate_density_at_moisture_content(moisture_content) -> float | np.ndarray:
             Calculates the density of the wood element considering its moisture content.
             Units: kg/m^3
-        calculate_weight_at_moisture_content(moisture_content) -> float:
+        calculate_density_array(moisture_content) -> np.ndarray:
+            Calculates the densities of the wood element for an array of moisture contents.
+            Units: kg/m^3
+        calculate_weight_at_moisture_content(moisture_content) -> float | np.ndarray:
             Calculates the weight of the wood element considering its moisture content.
             Units: kg
+        weights_batch(elements, moisture_content) -> np.ndarray:
+            Calculates the weights of many elements of this material.
+            Units: kg
     """
 
+    __slots__ = ("_material", "_element", "_sg", "_fsp", "_inv_fsp", "_k", "_sg1000", "_volume")
+
     def __init__(
         self,
         material: WoodProperties,
@@ -70,56 +167,190 @@ class WeightCalculator:
         self.material = material
         self.element = element
 
-    def calculate_density_at_moisture_content(self, moisture_content: float) -> float:
+    @property
+    def material(self) -> WoodProperties:
+        return self._material
+
+    @material.setter
+    def material(self, material: WoodProperties):
+        if material.specific_gravity < 0:
+            raise ValueError("Specific gravity must be non-negative.")
+        if material.fibre_saturation_point < 0:
+            raise ValueError("Fibre saturation point must be non-negative.")
+
+        self._material = material
+        self._sg = float(material.specific_gravity)
+        self._fsp = float(material.fibre_saturation_point)
+        self._inv_fsp = 1.0 / self._fsp if self._fsp else 0.0
+        self._k = 0.265 * self._sg
+        self._sg1000 = self._sg * 1000
+
+    @property
+    def element(self) -> ElementProperties:
+        return self._element
+
+    @element.setter
+    def element(self, element: ElementProperties):
+        if element.width < 0 or element.depth < 0 or element.length < 0:
+            raise ValueError("Element dimensions must be non-negative values.")
+
+        self._element = element
+        self._volume = float(element.volume)
+
+    def calculate_density_at_moisture_content(
+        self, moisture_content: float | np.ndarray | list | tuple
+    ) -> float | np.ndarray:
         """
         Calculates the density of the wood element at a given moisture content.
 
         Args:
-            moisture_content: The moisture content of the wood, as a percentage.
+            moisture_content: The moisture content of the wood, as a percentage,
+                or an array, list or tuple of them (see calculate_density_array).
 
         Returns:
-            The density of the wood element in kg/m^3.
+            The density of the wood element in kg/m^3, or an array of densities.
 
         Assumptions:
             - The moisture content is given as a percentage (e.g., 12.5 for 12.5%).
             - Density of water is 1000 kg/m^3
         """
-        if not isinstance(moisture_content, (int, float)):
-            raise TypeError("Moisture content must be a number (int or float)")
+        if isinstance(moisture_content, (np.ndarray, list, tuple)):
+            return self.calculate_density_array(moisture_content)
         if moisture_content < 0:
             raise ValueError("Moisture content must be non-negative.")
-        if self.material.fibre_saturation_point < 0:
-            raise ValueError("Fibre saturation point must be non-negative.")
 
-        if moisture_content <= self.material.fibre_saturation_point:
-            a = (self.material.fibre_saturation_point - moisture_content) / self.material.fibre_saturation_point
+        return _density_cached(
+            self._sg1000, self._k, self._fsp, self._inv_fsp, float(moisture_content)
+        )
 
-        else:
-            a = 0.0
+    def calculate_density_array(self, moisture_content: np.ndarray) -> np.ndarray:
+        """
+        Calculates the density of the wood element for an array of moisture contents.
+
+        Args:
+            moisture_content: The moisture contents of the wood, as percentages.
 
-        return (self.material.specific_gravity / (1 - 0.265 * a * self.material.specific_gravity)) *  (1 + moisture_content / 100) * 1000
+        Returns:
+            The densities of the wood element in kg/m^3, with the shape of moisture_content.
 
-    def calculate_weight_at_moisture_content(self, moisture_content: float) -> float:
+        Assumptions:
+            - The moisture contents are given as percentages (e.g., 12.5 for 12.5%).
+            - Density of water is 1000 kg/m^3
+        """
+        moisture_content = np.asarray(moisture_content, dtype=float)
+        if np.any(moisture_content < 0):
+            raise ValueError("Moisture content must be non-negative.")
+
+        return _density_kernel(self._sg, self._fsp, moisture_content)
+
+    def calculate_weight_at_moisture_content(
+        self, moisture_content: float | np.ndarray | list | tuple
+    ) -> float | np.ndarray:
         """
         Calculates the weight of the wood element at a given moisture content.
 
         Args:
-            moisture_content: The moisture content of the wood, as a percentage.
+            moisture_content: The moisture content of the wood, as a percentage,
+                or an array, list or tuple of them.
 
         Returns:
-            The weight of the wood element in kg.
+            The weight of the wood element in kg, or an array of weights.
 
         Assumptions:
            - The provided dimensions are valid (positive).
         """
-
-        if not isinstance(moisture_content, (int, float)):
-            raise TypeError("Moisture content must be a number (int or float)")
+        if isinstance(moisture_content, (np.ndarray, list, tuple)):
+            return self._volume * self.calculate_density_array(moisture_content)
         if moisture_content < 0:
             raise ValueError("Moisture content must be non-negative.")
-        if self.element.width < 0 or self.element.depth < 0 or self.element.length < 0:
-            raise ValueError("Element dimensions must be non-negative values.")
 
-        volume = self.element.width * self.element.depth * self.element.length
-        density = self.calculate_density_at_moisture_content(moisture_content) 
-        return volume * density
\ No newline at end of file
+        return self._volume * _density_cached(
+            self._sg1000, self._k, self._fsp, self._inv_fsp, float(moisture_content)
+        )
+
+    def weights_batch(self, elements: ElementArray, moisture_content: float) -> np.ndarray:
+        """
+        Calculates the weights of many elements of this material at a given moisture content.
+
+        Args:
+            elements: The dimensions of the elements.
+            moisture_content: The moisture content of the wood, as a percentage.
+
+        Returns:
+            The weights of the elements in kg, with the shape of elements.volumes.
+
+        Assumptions:
+            The element arrays were validated when the ElementArray was built.
+        """
+        return elements.volumes * self.calculate_density_at_moisture_content(moisture_content)
+
+
+def density_grid(
+    specific_gravity: np.ndarray,
+    fibre_saturation_point: float | np.ndarray,
+    moisture_content: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculates the wood density for every combination of specific gravity and moisture content.
+
+    Args:
+        specific_gravity: A 1-D array of specific gravities.
+        fibre_saturation_point: The fibre saturation point of the wood, as a percentage,
+            or a 1-D array with one fibre saturation point per specific gravity.
+        moisture_content: A 1-D array of moisture contents, as percentages.
+
+    Returns:
+        A 2-D array of densities in kg/m^3, indexed [specific_gravity, moisture_content].
+
+    Assumptions:
+        - The inputs are valid (see WeightCalculator); they are not checked here.
+        - Density of water is 1000 kg/m^3
+    """
+    sg = np.asarray(specific_gravity)[:, np.newaxis]
+    mc = np.asarray(moisture_content)[np.newaxis, :]
+    fsp = fibre_saturation_point
+    if np.ndim(fsp):
+        fsp = np.asarray(fsp)[:, np.newaxis]
+    return _density_kernel(sg, fsp, mc)
+
+
+def _density_kernel(specific_gravity, fibre_saturation_point, moisture_content):
+    """
+    Evaluates the density formula element-wise over broadcastable arrays.
+
+    Shared by the array paths; the scalar method keeps its own float arithmetic.
+    The fibre saturation point is inverted once, so each cell costs a multiply
+    rather than a division; a zero fibre saturation point gives a = 0.
+    """
+    fsp = fibre_saturation_point
+    if np.ndim(fsp):
+        inv_fsp = np.divide(1.0, fsp, out=np.zeros(np.shape(fsp)), where=fsp != 0)
+    else:
+        inv_fsp = 1.0 / fsp if fsp else 0.0
+    a = np.maximum(fsp - moisture_content, 0.0)
+    a *= inv_fsp
+
+    # Evaluate the rest in place in a single result-sized buffer.
+    sg = specific_gravity
+    density = np.asarray((0.265 * sg) * a)
+    np.subtract(1.0, density, out=density)
+    np.divide(sg, density, out=density)
+    density *= (1 + moisture_content * 0.01) * 1000
+    return density
+
+
+@lru_cache(maxsize=1024)
+def _density_cached(sg1000, k, fibre_saturation_point, inv_fsp, moisture_content):
+    """
+    Evaluates the density formula for one moisture content.
+
+    Memoized because callers tend to revisit a few moisture contents
+    (e.g. 12%, 19%, green) for every element of the same material. A hit
+    is cheaper than the arithmetic, but a miss costs roughly twice as much,
+    so streams of distinct moisture contents (e.g. Monte Carlo sampling)
+    should use calculate_density_array instead. All arguments must be
+    Python floats so that equal values of different types cannot share an
+    entry and leak their type into later results.
+    """
+    a = max(fibre_saturation_point - moisture_content, 0.0) * inv_fsp
+    return sg1000 / (1 - k * a) * (1 + moisture_content * 0.01)